@@ -1,17 +1,191 @@
 """Module to execute adb commands."""
 
+import atexit
+import io
+import json
+import os
+import re
+import shutil
+import socket
 import subprocess
+import threading
+import time
 from pathlib import Path
 from time import sleep
 from xml.etree import ElementTree
 
+# Resolved once so each of the hundreds of spawns skips the PATH lookup.
+_ADB = shutil.which("adb") or "adb"
 
-def run_adb_command(command: list) -> subprocess.CompletedProcess:
+# We hold no problematic inheritable fds, so POSIX spawns can skip the
+# fd-enumeration pass that close_fds=True performs.
+_CLOSE_FDS = os.name != "posix"
+
+_CACHE_DIR = Path.home() / ".cache" / "samsung-setup"
+_CACHE_TTL = 300  # seconds before the on-disk package cache goes stale
+
+_device_serial_cache: str | None = None
+_package_cache: dict[str, set[str]] | None = None
+# Serializes cache mutation + rewrite: uninstall workers update the cache
+# concurrently, and unsynchronized writers would race on the shared tmp
+# file (and sort sets mid-mutation).
+_package_cache_lock = threading.Lock()
+
+_TLS = threading.local()
+_shell_sessions: "list[AdbShell]" = []
+_shell_sessions_lock = threading.Lock()
+
+
+class AdbShell:
+    """
+    A long-lived `adb shell` session.
+
+    Every fresh `adb shell` subprocess pays ADB transport setup before the
+    command even starts. This class keeps a single shell open and sends
+    commands down its stdin, delimiting each command's output with a
+    sentinel line that also carries the exit status.
+    """
+
+    def __init__(self) -> None:
+        self._process: subprocess.Popen | None = None
+
+    def __enter__(self) -> "AdbShell":
+        self._process = subprocess.Popen(
+            [_ADB, "shell"],
+            bufsize=0,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            close_fds=_CLOSE_FDS,
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run(self, command: str) -> tuple[int, str]:
+        """
+        Runs a command in the persistent shell session.
+
+        The sentinel is emitted via printf with a leading newline so it
+        lands on a fresh line even when the command's output does not end
+        in one; the resulting empty line is stripped from the output.
+
+        Args:
+            command (str): The shell command to execute on the device.
+
+        Returns:
+            tuple[int, str]: The command's exit status and its output.
+
+        Raises:
+            RuntimeError: If the shell session ended before the command
+                finished.
+        """
+        self._process.stdin.write(f"{command}; printf '\\n__DONE_%s__\\n' $?\n")
+        lines = []
+        for line in self._process.stdout:
+            line = line.rstrip("\r\n")
+            if line.startswith("__DONE_") and line.endswith("__"):
+                if lines and lines[-1] == "":
+                    lines.pop()
+                return int(line[len("__DONE_") : -2]), "\n".join(lines)
+            lines.append(line)
+        raise RuntimeError("adb shell session closed unexpectedly")
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+def batch_shell(script: str) -> str:
+    """
+    Runs a multi-command shell script on the device in a single connection.
+
+    Feeding the whole script to one `adb shell` invocation amortizes the
+    transport setup across every command in the batch, instead of paying it
+    once per command.
+
+    Args:
+        script (str): The shell script to execute, one command per line.
+
+    Returns:
+        str: The combined stdout of the script.
+
+    Raises:
+        subprocess.CalledProcessError: If the shell exits with a non-zero status.
+    """
+    result = subprocess.run(
+        [_ADB, "shell"],
+        check=True,
+        capture_output=True,
+        text=True,
+        input=script,
+        close_fds=_CLOSE_FDS,
+    )
+    return result.stdout
+
+
+def _shell() -> AdbShell:
+    """
+    Returns the persistent shell session owned by the calling thread.
+
+    Each worker thread lazily opens its own AdbShell, so concurrent workers
+    multiplex over a handful of long-lived connections instead of spawning
+    a fresh adb process per command — or contending on a single shared
+    pipe. Every session is tracked for cleanup at interpreter exit.
+
+    Returns:
+        AdbShell: The calling thread's shell session.
+    """
+    session = getattr(_TLS, "shell", None)
+    if session is None:
+        session = _TLS.shell = AdbShell().__enter__()
+        with _shell_sessions_lock:
+            _shell_sessions.append(session)
+    return session
+
+
+@atexit.register
+def _close_shell_sessions() -> None:
+    """Closes every per-thread shell session at interpreter exit."""
+    with _shell_sessions_lock:
+        for session in _shell_sessions:
+            session.close()
+        _shell_sessions.clear()
+
+
+def shell_run(command: str) -> str:
+    """
+    Runs a device shell command through the calling thread's session.
+
+    Args:
+        command (str): The shell command to execute on the device.
+
+    Returns:
+        str: The command's output.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+            status, mirroring run_adb_command.
+    """
+    returncode, output = _shell().run(command)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, output)
+    return output
+
+
+def run_adb_command(command: list, text: bool = True) -> subprocess.CompletedProcess:
     """
     Executes an ADB (Android Debug Bridge) command using the subprocess module.
 
     Args:
         command (list): A list of strings representing the ADB command and its arguments.
+        text (bool): Whether to decode stdout/stderr as text. Pass False for
+            large or binary payloads (e.g. UI hierarchy dumps) where the
+            UTF-8 decode is wasted work.
 
     Returns:
         subprocess.CompletedProcess: The result of the executed command, containing
@@ -20,7 +194,9 @@ def run_adb_command(command: list) -> subprocess.CompletedProcess:
     Raises:
         subprocess.CalledProcessError: If the command exits with a non-zero status.
     """
-    return subprocess.run(command, check=True, capture_output=True, text=True)
+    return subprocess.run(
+        command, check=True, capture_output=True, text=text, close_fds=_CLOSE_FDS
+    )
 
 
 def pair(url: str, pairing_code: str) -> None:
@@ -34,7 +210,7 @@ def pair(url: str, pairing_code: str) -> None:
     Returns:
         None
     """
-    command = ["adb", "pair", url, pairing_code]
+    command = [_ADB, "pair", url, pairing_code]
     run_adb_command(command)
 
 
@@ -43,19 +219,37 @@ def extract(package_name: str, target: Path) -> None:
     Extracts the APK file of a specified package from a connected Android device
     using ADB (Android Debug Bridge) and saves it to the target directory.
 
+    The APK paths are looked up over the persistent shell session and parsed
+    in a single pass. A regular package is streamed straight to
+    `<target>/<package>.apk` via `adb exec-out cat`; a split package gets one
+    file per APK under `<target>/<package>/`, since concatenated splits would
+    not be installable. The bytes are streamed to disk rather than buffered
+    in memory.
+
     Args:
         package_name (str): The name of the package whose APK is to be extracted.
         target (Path): The directory where the extracted APK file will be saved.
 
     Raises:
-        RuntimeError: If the ADB command fails or the APK path cannot be determined.
+        subprocess.CalledProcessError: If the ADB command fails.
     """
-    command = ["adb", "shell", "pm", "path", package_name]
-    result = run_adb_command(command)
-    apk_path = result.stdout.strip().replace("package:", "").split("\n")[0]
-    if apk_path:
-        command = ["adb", "pull", apk_path, f"{target}/{package_name}.apk"]
-        run_adb_command(command)
+    output = shell_run(f"pm path {package_name}")
+    prefix = "package:"
+    apk_paths = [
+        line[len(prefix) :] for line in output.splitlines() if line.startswith(prefix)
+    ]
+    if not apk_paths:
+        return
+    if len(apk_paths) == 1:
+        destinations = [target / f"{package_name}.apk"]
+    else:
+        package_dir = target / package_name
+        package_dir.mkdir(parents=True, exist_ok=True)
+        destinations = [package_dir / Path(apk_path).name for apk_path in apk_paths]
+    for apk_path, destination in zip(apk_paths, destinations):
+        with open(destination, "wb") as apk_file:
+            command = [_ADB, "exec-out", "cat", apk_path]
+            subprocess.run(command, check=True, stdout=apk_file, close_fds=_CLOSE_FDS)
 
 
 def connect(url: str) -> None:
@@ -69,25 +263,195 @@ def connect(url: str) -> None:
     Returns:
         None
     """
-    command = ["adb", "connect", url]
+    global _connected_cache
+    _connected_cache = False
+    command = [_ADB, "connect", url]
     run_adb_command(command)
 
 
+_DEVICE_RE = re.compile(r"^\S+\tdevice$", re.MULTILINE)
+_ADB_SERVER_PORT = 5037
+
+_connected_cache = False
+
+
+def _adb_server_alive() -> bool:
+    """
+    Checks whether an adb server is listening on the local default port.
+
+    A non-blocking TCP probe is far cheaper than spawning `adb devices`,
+    which would also implicitly start the server.
+
+    Returns:
+        bool: True if the server socket accepted the connection.
+    """
+    sock = socket.socket()
+    sock.settimeout(0.05)
+    try:
+        return sock.connect_ex(("127.0.0.1", _ADB_SERVER_PORT)) == 0
+    finally:
+        sock.close()
+
+
 def is_connected() -> bool:
     """
     Checks if any devices are connected via ADB (Android Debug Bridge).
 
-    This function runs the `adb devices` command to list all connected devices
-    and their statuses. It parses the output to determine if any device is
-    listed as "device", which indicates a successful connection.
+    The adb server socket is probed first: if no server is listening, no
+    device can be connected and the `adb devices` subprocess is skipped
+    entirely. Otherwise the command output is scanned with a precompiled
+    regex anchored on the "SERIAL\\tdevice" line format, so the header and
+    daemon-startup noise (which also contain the word "device") never
+    match. A positive result is cached for the lifetime of the process;
+    connect() clears the cache.
 
     Returns:
         bool: True if at least one device is connected, False otherwise.
     """
-    command = ["adb", "devices"]
+    global _connected_cache
+    if _connected_cache:
+        return True
+    if not _adb_server_alive():
+        return False
+    command = [_ADB, "devices"]
     result = run_adb_command(command)
-    deviceinfo_list = result.stdout.splitlines()[1:]
-    return any("device" in deviceinfo for deviceinfo in deviceinfo_list)
+    _connected_cache = bool(_DEVICE_RE.search(result.stdout))
+    return _connected_cache
+
+
+def _device_serial() -> str:
+    """
+    Returns the serial number of the connected Android device.
+
+    The serial is queried once via `adb get-serialno` and cached for the
+    lifetime of the process, since it cannot change without reconnecting.
+
+    Returns:
+        str: The device serial number.
+    """
+    global _device_serial_cache
+    if _device_serial_cache is None:
+        result = run_adb_command([_ADB, "get-serialno"])
+        _device_serial_cache = result.stdout.strip()
+    return _device_serial_cache
+
+
+def _cache_file() -> Path:
+    return _CACHE_DIR / f"{_device_serial()}.json"
+
+
+def _write_package_cache() -> None:
+    """
+    Writes the in-memory package cache to disk atomically.
+
+    The cache is written to a temporary file first and moved into place with
+    `os.replace`, so a concurrent reader never sees a half-written file.
+    Callers must hold `_package_cache_lock`: the tmp path is shared, so two
+    unsynchronized writers could rename it away from under each other.
+    """
+    if _package_cache is None:
+        return
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "installed": sorted(_package_cache["installed"]),
+        "enabled": sorted(_package_cache["enabled"]),
+        "ts": time.time(),
+    }
+    cache_file = _cache_file()
+    tmp_file = cache_file.with_suffix(".tmp")
+    tmp_file.write_text(json.dumps(payload))
+    os.replace(tmp_file, cache_file)
+
+
+def _load_package_cache() -> dict[str, set[str]]:
+    """
+    Returns the installed/enabled package sets, loading them lazily.
+
+    A fresh-enough on-disk cache (keyed by device serial) is used when
+    available; otherwise the sets are fetched from the device via
+    `pm list packages` and the cache is rewritten.
+
+    Returns:
+        dict[str, set[str]]: A dict with "installed" and "enabled" sets.
+    """
+    global _package_cache
+    with _package_cache_lock:
+        if _package_cache is not None:
+            return _package_cache
+        try:
+            data = json.loads(_cache_file().read_text())
+            if time.time() - data["ts"] < _CACHE_TTL:
+                _package_cache = {
+                    "installed": set(data["installed"]),
+                    "enabled": set(data["enabled"]),
+                }
+                return _package_cache
+        except (OSError, ValueError, KeyError):
+            pass
+        installed = set(shell_run("pm list packages").replace("package:", "").split())
+        enabled = set(shell_run("pm list packages -e").replace("package:", "").split())
+        _package_cache = {"installed": installed, "enabled": enabled}
+        _write_package_cache()
+        return _package_cache
+
+
+def _update_package_cache(
+    package_name: str, *, installed: bool | None = None, enabled: bool | None = None
+) -> None:
+    """
+    Records a package state change in the cache after a mutating command.
+
+    The mutation and the rewrite happen under the cache lock, since the
+    uninstall workers call this concurrently.
+
+    Args:
+        package_name (str): The package whose state changed.
+        installed (bool | None): New installed state, or None to leave as is.
+        enabled (bool | None): New enabled state, or None to leave as is.
+    """
+    with _package_cache_lock:
+        if _package_cache is None:
+            return
+        for key, state in (("installed", installed), ("enabled", enabled)):
+            if state is True:
+                _package_cache[key].add(package_name)
+            elif state is False:
+                _package_cache[key].discard(package_name)
+        _write_package_cache()
+
+
+def _invalidate_package_cache() -> None:
+    """Drops the package cache in memory and on disk."""
+    global _package_cache
+    with _package_cache_lock:
+        _package_cache = None
+        _cache_file().unlink(missing_ok=True)
+
+
+def list_installed() -> set[str]:
+    """
+    Lists all packages installed on the connected Android device.
+
+    The result comes from the lazily-refreshed package cache, so callers can
+    perform membership tests without paying an ADB round-trip per package.
+
+    Returns:
+        set[str]: The names of all installed packages.
+    """
+    return _load_package_cache()["installed"]
+
+
+def list_enabled() -> set[str]:
+    """
+    Lists all packages enabled on the connected Android device.
+
+    The result comes from the lazily-refreshed package cache, so callers can
+    perform membership tests without paying an ADB round-trip per package.
+
+    Returns:
+        set[str]: The names of all enabled packages.
+    """
+    return _load_package_cache()["enabled"]
 
 
 def is_installed(package_name: str) -> bool:
@@ -100,27 +464,20 @@ def is_installed(package_name: str) -> bool:
     Returns:
         bool: True if the package is installed, False otherwise.
     """
-    command = ["adb", "shell", "pm", "list", "packages", package_name]
-    result = run_adb_command(command)
-    return package_name in result.stdout
+    return package_name in list_installed()
 
 
 def is_enabled(package_name: str) -> bool:
     """
     Checks if a specific package is enabled on an Android device.
 
-    This function uses the `adb` command to list all enabled packages on the
-    connected Android device and determines if the specified package is among them.
-
     Args:
         package_name (str): The name of the package to check.
 
     Returns:
         bool: True if the package is enabled, False otherwise.
     """
-    command = ["adb", "shell", "pm", "list", "packages", "-e"]
-    result = run_adb_command(command)
-    return package_name in result.stdout
+    return package_name in list_enabled()
 
 
 def install(apk_path: Path) -> None:
@@ -133,8 +490,9 @@ def install(apk_path: Path) -> None:
     Returns:
         None
     """
-    command = ["adb", "install", str(apk_path)]
+    command = [_ADB, "install", str(apk_path)]
     run_adb_command(command)
+    _invalidate_package_cache()
 
 
 def clear_data(package_name: str) -> None:
@@ -155,8 +513,7 @@ def clear_data(package_name: str) -> None:
     Raises:
         Any exceptions raised by the `run_adb_command` function will propagate.
     """
-    command = ["adb", "shell", "pm", "clear", package_name]
-    run_adb_command(command)
+    shell_run(f"pm clear {package_name}")
 
 
 def uninstall(package_name: str) -> None:
@@ -164,7 +521,9 @@ def uninstall(package_name: str) -> None:
     Uninstalls the specified package from the connected Android device.
 
     This function attempts to uninstall the package for all users first.
-    If that fails, it retries the uninstallation for the current user (user 0).
+    Only if that fails does it retry the uninstallation for the current
+    user (user 0), so the common successful case costs a single ADB
+    round-trip.
 
     Args:
         package_name (str): The package name of the application to uninstall.
@@ -178,13 +537,12 @@ def uninstall(package_name: str) -> None:
         the `run_adb_command` function to execute the adb commands.
     """
     try:
-        command = ["adb", "uninstall", package_name]
+        command = [_ADB, "uninstall", package_name]
         run_adb_command(command)
-    except:
-        pass
-    finally:
-        command = ["adb", "uninstall", "--user", "0", package_name]
+    except subprocess.CalledProcessError:
+        command = [_ADB, "uninstall", "--user", "0", package_name]
         run_adb_command(command)
+    _update_package_cache(package_name, installed=False, enabled=False)
 
 
 def enable(package_name: str) -> None:
@@ -197,16 +555,17 @@ def enable(package_name: str) -> None:
     Returns:
         None
     """
-    command = ["adb", "shell", "pm", "enable", package_name]
-    run_adb_command(command)
+    shell_run(f"pm enable {package_name}")
+    _update_package_cache(package_name, enabled=True)
 
 
 def disable(package_name: str) -> None:
     """
     Disables an Android package on a connected device using ADB (Android Debug Bridge).
 
-    This function first attempts to uninstall the specified package. If the uninstallation
-    fails or is skipped, it proceeds to disable the package for the current user.
+    This function first attempts to uninstall the specified package. Only if
+    the uninstallation fails does it fall back to disabling the package for
+    the current user, so the happy path pays a single ADB round-trip.
 
     Args:
         package_name (str): The name of the Android package to disable.
@@ -217,16 +576,33 @@ def disable(package_name: str) -> None:
     Note:
         - Ensure that ADB is installed and properly configured on your system.
         - The connected Android device must have USB debugging enabled.
-        - This function suppresses exceptions during the uninstallation process.
     """
     try:
-        command = ["adb", "uninstall", package_name]
-        run_adb_command(command)
-    except:
-        pass
-    finally:
-        command = ["adb", "shell", "pm", "disable-user", package_name]
+        command = [_ADB, "uninstall", package_name]
         run_adb_command(command)
+    except subprocess.CalledProcessError:
+        shell_run(f"pm disable-user {package_name}")
+    _update_package_cache(package_name, enabled=False)
+
+
+def mark_disabled(package_names: list[str]) -> None:
+    """
+    Records that packages were disabled outside the per-package helpers.
+
+    Batched shell scripts (see batch_shell) bypass disable() and would
+    otherwise leave the package cache claiming the packages are still
+    enabled until the TTL expires. All mutations land in a single cache
+    rewrite under the cache lock.
+
+    Args:
+        package_names (list[str]): The packages that were disabled.
+    """
+    with _package_cache_lock:
+        if _package_cache is None:
+            return
+        for package_name in package_names:
+            _package_cache["enabled"].discard(package_name)
+        _write_package_cache()
 
 
 def tap(x: int, y: int) -> None:
@@ -240,8 +616,72 @@ def tap(x: int, y: int) -> None:
     Returns:
         None
     """
-    command = ["adb", "shell", "input", "tap", str(x), str(y)]
-    run_adb_command(command)
+    shell_run(f"input tap {x} {y}")
+
+
+def _trim_ui_dump(output: bytes) -> bytes:
+    """
+    Trims the raw output of `uiautomator dump /dev/tty` down to the XML payload.
+
+    The dump is followed by a `UI hierarchy dumped to: /dev/tty` trailer (and
+    occasionally preceded by warnings), both of which would trip up the XML
+    parser. The payload stays as bytes: ElementTree parses bytes natively,
+    honouring the XML encoding declaration, so decoding it in Python first
+    would just be an extra pass over the buffer.
+
+    Args:
+        output (bytes): The raw stdout of the `uiautomator dump` command.
+
+    Returns:
+        bytes: The XML document contained in the output.
+    """
+    start = output.index(b"<?xml")
+    end = output.rindex(b">") + 1
+    return output[start:end]
+
+
+_INSTALL_RE = re.compile(
+    rb'text="Install"[^>]*?bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"'
+    rb'|bounds="\[(\d+),(\d+)\]\[(\d+),(\d+)\]"[^>]*?text="Install"'
+)
+
+
+def _locate_install_button(dump: bytes) -> tuple[int, int] | None:
+    """
+    Finds the center of the "Install" button in a raw UI hierarchy dump.
+
+    A precompiled regex scans the raw bytes for the button's bounds first,
+    which is roughly an order of magnitude faster than building the full
+    ElementTree for a typical Play Store screen. The XML parse is kept as a
+    correctness fallback for attribute orderings the regex does not cover,
+    and streams through iterparse so it stops at the first matching node
+    instead of materializing the hundreds of nodes a dump typically holds.
+
+    Args:
+        dump (bytes): The raw stdout of the `uiautomator dump` command.
+
+    Returns:
+        tuple[int, int] | None: The (x, y) center of the button, or None if
+        the dump contains no "Install" button.
+    """
+    match = _INSTALL_RE.search(dump)
+    if match:
+        x1, y1, x2, y2 = (int(group) for group in match.groups() if group is not None)
+        return ((x1 + x2) // 2, (y1 + y2) // 2)
+    buffer = io.BytesIO(_trim_ui_dump(dump))
+    install_button = None
+    for _, element in ElementTree.iterparse(buffer, events=("start",)):
+        if element.tag == "node" and element.attrib.get("text") == "Install":
+            install_button = element
+            break
+        element.clear()
+    if install_button is None:
+        return None
+    x1, y1, x2, y2 = map(
+        int,
+        install_button.attrib.get("bounds").replace("][", ",").strip("[]").split(","),
+    )
+    return ((x1 + x2) // 2, (y1 + y2) // 2)
 
 
 def find_install_button() -> tuple[int, int] | None:
@@ -250,45 +690,35 @@ def find_install_button() -> tuple[int, int] | None:
     returns its center coordinates.
 
     This function uses the Android Debug Bridge (ADB) to dump the current UI hierarchy
-    and parse it to find a button with the text "Install". If found, it calculates the
+    and scan it for a button with the text "Install". If found, it calculates the
     center coordinates of the button's bounding box.
 
     Returns:
         tuple[int, int] | None: A tuple containing the (x, y) coordinates of the center
-        of the "Install" button if found, or None if the button is not found after the
-        specified number of attempts.
+        of the "Install" button if found, or None if the button does not appear within
+        the polling budget.
 
     Raises:
         xml.etree.ElementTree.ParseError: If the XML dump of the UI hierarchy is invalid.
 
     Notes:
-        - The function retries up to `max_attempts` times, with a 1-second delay between
-          attempts, to account for potential delays in the UI rendering.
+        - The UI hierarchy is streamed back over a single `adb exec-out` call
+          instead of dumping to /sdcard and reading it back in a second command.
+        - The screen is polled immediately and then every 100 ms, backing off
+          to 250 ms after the first second, so a button that renders quickly
+          is found without paying any fixed sleep.
         - The ADB commands used require proper permissions and a connected Android device.
     """
-    max_attempts = 5
-    for i in range(max_attempts):
-        sleep(1)
-        command = ["adb", "shell", "uiautomator", "dump"]
-        run_adb_command(command)
-        command = ["adb", "shell", "cat", "/sdcard/window_dump.xml"]
-        result = run_adb_command(command)
-        root = ElementTree.fromstring(result.stdout)
-        nodes = root.findall(".//node")
-        install_button = next(
-            (node for node in nodes if node.attrib.get("text") == "Install"), None
-        )
-        if install_button is not None:
-            break
-    else:
-        return None
-    x1, y1, x2, y2 = map(
-        int,
-        install_button.attrib.get("bounds").replace("][", ",").strip("[]").split(","),
-    )
-    x = (x1 + x2) // 2
-    y = (y1 + y2) // 2
-    return (x, y)
+    start = time.monotonic()
+    deadline = start + 8.0
+    while time.monotonic() < deadline:
+        command = [_ADB, "exec-out", "uiautomator", "dump", "/dev/tty"]
+        result = run_adb_command(command, text=False)
+        coordinates = _locate_install_button(result.stdout)
+        if coordinates is not None:
+            return coordinates
+        sleep(0.1 if time.monotonic() - start < 1.0 else 0.25)
+    return None
 
 
 def click_install_in_playstore():
@@ -318,7 +748,7 @@ def navigate_playstore(package_name: str) -> None:
         None
     """
     command = [
-        "adb",
+        _ADB,
         "shell",
         "am",
         "start",
@@ -345,3 +775,4 @@ def install_from_playstore(package_name: str) -> None:
     """
     navigate_playstore(package_name)
     click_install_in_playstore()
+    _update_package_cache(package_name, installed=True, enabled=True)
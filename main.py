@@ -1,9 +1,17 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from time import sleep
 
 import adb
 from packages import to_freezze, to_install_from_playstore, to_uninstall
 
+# More than a handful of concurrent adb commands can overwhelm the adb
+# server on some hosts, so the pool size is capped but overridable.
+MAX_WORKERS = int(os.environ.get("ADB_THREADS", "8"))
+
+print_lock = threading.Lock()
+
 
 def connect():
     if not adb.is_connected():
@@ -17,55 +25,80 @@ def connect():
             adb.connect(url)
 
 
-def freeze():
-    for package in to_freezze:
-        if not adb.is_enabled(package):
-            continue
-        print(f"Disabling: {package}...", end=" ")
-        try:
-            adb.clear_data(package)
-            adb.disable(package)
-        except:
-            print("Failed!!!")
-        else:
-            print("Done!")
+def report(action: str, package: str, ok: bool):
+    with print_lock:
+        print(f"{action}: {package}... {'Done!' if ok else 'Failed!!!'}")
+
+
+def _uninstall_one(package: str, target: Path):
+    try:
+        # No clear_data here: pm uninstall wipes the app data anyway, so
+        # clearing first is a wasted round-trip. freeze() still clears,
+        # since disable-user preserves data.
+        adb.extract(package, target)
+        adb.uninstall(package)
+    except:
+        report("Uninstalling", package, False)
+    else:
+        report("Uninstalling", package, True)
+
 
+def _install_one(package: str):
+    try:
+        adb.install_from_playstore(package)
+    except:
+        report("Installing", package, False)
+    else:
+        report("Installing", package, True)
 
-def uninstall():
+
+def freeze(packages: list[str]):
+    # One shell invocation clears and disables every package in a single
+    # adb connection instead of two round-trips per package.
+    if not packages:
+        return
+    script = "".join(
+        f"pm clear {package} && pm disable-user {package}"
+        f" && echo OK_{package} || echo FAIL_{package}\n"
+        for package in packages
+    )
+    statuses = set(adb.batch_shell(script).split())
+    frozen = []
+    for package in packages:
+        ok = f"OK_{package}" in statuses
+        report("Disabling", package, ok)
+        if ok:
+            frozen.append(package)
+    adb.mark_disabled(frozen)
+
+
+def uninstall(packages: list[str]):
+    if not packages:
+        return
     target = Path.home() / "sapps"
     target.mkdir(parents=True, exist_ok=True)
-    for package in to_uninstall:
-        if not adb.is_installed(package):
-            continue
-        print(f"Uninstalling: {package}...", end=" ")
-        try:
-            adb.clear_data(package)
-            adb.extract(package, target)
-            adb.uninstall(package)
-        except:
-            print("Failed!!!")
-        else:
-            print("Done")
-
-
-def install_from_playstore():
-    for package in to_install_from_playstore:
-        if adb.is_installed(package):
-            continue
-        print(f"Installing: {package}...", end=" ")
-        try:
-            adb.install_from_playstore(package)
-        except:
-            print("Failed!!!")
-        else:
-            print("Done")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(lambda package: _uninstall_one(package, target), packages))
+
+
+def install_from_playstore(packages: list[str]):
+    # Play Store installs drive the on-screen UI, so they must stay serial:
+    # concurrent installs would fight over the visible install button.
+    for package in packages:
+        _install_one(package)
 
 
 def main():
     connect()
-    freeze()
-    uninstall()
-    install_from_playstore()
+    installed = adb.list_installed()
+    enabled = adb.list_enabled()
+    # Filter the configured lists down to the packages that need work, so
+    # the stages never iterate entries that are already in the right state.
+    freeze([package for package in to_freezze if package in enabled])
+    uninstall([package for package in to_uninstall if package in installed])
+    install_from_playstore(
+        [package for package in to_install_from_playstore if package not in installed]
+    )
 
 
 if __name__ == "__main__":